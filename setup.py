@@ -9,7 +9,7 @@ setup(
     ],
     entry_points={
         'console_scripts': [
-            'task-cli = task_cli:cli',
+            'task-cli = task_cli:main',
         ],
     },
 ) 
\ No newline at end of file
@@ -1,33 +1,239 @@
 import click
-from datetime import datetime
+from bisect import bisect_left
+from contextlib import contextmanager
 from pathlib import Path
-import json
+import os
+import re
+import sys
 from typing import Dict, List, Optional
 
+# datetime and json are imported inside the functions that need them so
+# commands that never touch a task (e.g. --help) skip their import cost
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 TASKS_FILE = Path("tasks.json")
 
-def load_tasks() -> List[Dict]:
-    """Load tasks from file, handling empty or corrupted files"""
+# Files at least this big are parsed via mmap rather than read_bytes
+_MMAP_MIN_SIZE = 1_000_000
+
+# Compact codes for the status column; filters compare ints, not strings
+_STATUS = {"todo": 0, "in-progress": 1, "done": 2}
+
+# Last parsed tasks file, keyed by path and stat so any write to the file
+# (including direct writes in tests) invalidates the entry automatically
+_load_cache: Dict[tuple, Dict] = {}
+
+def _build_state(tasks: List[Dict], legacy: bool = False) -> Dict:
+    """Bundle a parsed task list with its derived lookup structures.
+
+    Alongside the row-oriented task list (the public representation),
+    the state carries columnar views — parallel 'ids' and 'statuses'
+    lists — so scans and filters run over plain lists instead of
+    hashing into every task dict.
+    """
+    ids = [task['id'] for task in tasks]
+    return {
+        'tasks': tasks,
+        'ids': ids,
+        # Unknown statuses get -1, which never matches a known filter code
+        'statuses': [_STATUS.get(task['status'], -1) for task in tasks],
+        'index': {task_id: i for i, task_id in enumerate(ids)},
+        # Highest ID ever assigned, so add_task needn't rescan the list
+        'max_id': max(ids, default=0),
+        # True when the file still holds a legacy whole-array document
+        'legacy': legacy,
+    }
+
+def _load_state() -> Dict:
+    """Load the tasks file plus derived lookup structures, cached per stat"""
     try:
-        if not TASKS_FILE.exists() or TASKS_FILE.stat().st_size == 0:
-            # If file doesn't exist or is empty, return empty list
-            return []
-            
-        with TASKS_FILE.open() as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError as e:
-                # Fail with error when JSON is corrupted
-                raise click.ClickException(f"Error: Tasks file is corrupted. {str(e)}")
-                
+        if not TASKS_FILE.exists():
+            # If file doesn't exist, treat as empty list
+            return _build_state([])
+
+        st = TASKS_FILE.stat()
+        if st.st_size == 0:
+            # If file is empty, treat as empty list
+            return _build_state([])
+
+        key = (str(TASKS_FILE), st.st_mtime_ns, st.st_size)
+        cached = _load_cache.get(key)
+        if cached is not None:
+            return cached
+
+        import json
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            if st.st_size >= _MMAP_MIN_SIZE:
+                # Large file: parse straight out of the mapped pages
+                # instead of copying the whole file into a bytes object
+                import mmap
+                with TASKS_FILE.open('rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if mm[:16].lstrip()[:1] == b'[':
+                            # Legacy format: the whole file is one JSON array
+                            legacy = True
+                            tasks = loads(memoryview(mm) if orjson is not None else mm[:])
+                        else:
+                            # Current format: one task object per line (NDJSON)
+                            legacy = False
+                            tasks = [loads(line) for line in iter(mm.readline, b'') if line.strip()]
+            else:
+                # Small file: slurp it in one read; json.load goes through
+                # the stream interface and is slower for files this size
+                data = TASKS_FILE.read_bytes()
+                legacy = data.lstrip()[:1] == b'['
+                if legacy:
+                    tasks = loads(data)
+                else:
+                    tasks = [loads(line) for line in data.splitlines() if line.strip()]
+        except json.JSONDecodeError as e:
+            # Fail with error when JSON is corrupted
+            raise click.ClickException(f"Error: Tasks file is corrupted. {str(e)}")
+
+        state = _build_state(tasks, legacy=legacy)
+        _load_cache.clear()
+        _load_cache[key] = state
+        return state
+
     except Exception as e:
         if isinstance(e, click.ClickException):
             raise
         raise click.ClickException(f"Error accessing tasks file: {str(e)}")
 
+def load_tasks() -> List[Dict]:
+    """Load tasks from file, handling empty or corrupted files"""
+    return _load_state()['tasks']
+
+def _encode_line(task: Dict) -> bytes:
+    """Encode one task as a single NDJSON line"""
+    if orjson is not None:
+        return orjson.dumps(task) + b'\n'
+    import json
+    # Compact separators to match orjson's whitespace-free output
+    return (json.dumps(task, separators=(',', ':')) + '\n').encode()
+
+def _fsync_if_durable(f) -> None:
+    # Writes are buffered by default: for a local single-user tool the OS
+    # flushing on its own schedule is plenty, and skipping fsync keeps
+    # save latency at memory speed. TASK_CLI_SYNC=full opts into syncing
+    # every write to disk, akin to SQLite's synchronous=FULL.
+    if os.environ.get('TASK_CLI_SYNC') == 'full':
+        f.flush()
+        os.fsync(f.fileno())
+
 def save_tasks(tasks: List[Dict]) -> None:
-    with TASKS_FILE.open('w') as f:
-        json.dump(tasks, f, indent=2)
+    # The file is about to change out from under any cached parse
+    _load_cache.clear()
+    # One task per line (NDJSON) so add_task can append instead of
+    # rewriting; encode everything first and write the payload in one call.
+    # Write to a sibling tempfile and rename over the real file so a crash
+    # mid-write can never leave tasks.json half-written.
+    payload = b''.join(_encode_line(task) for task in tasks)
+    tmp = TASKS_FILE.with_suffix('.json.tmp')
+    try:
+        with tmp.open('wb') as f:
+            f.write(payload)
+            _fsync_if_durable(f)
+        os.replace(tmp, TASKS_FILE)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+@contextmanager
+def open_tasks():
+    """Load tasks once, yield the list for in-place edits, save once on exit.
+
+    Pass the yielded list as the ``tasks`` argument of add_task,
+    update_task and delete_task to batch many mutations into a single
+    read and a single write.
+    """
+    tasks = load_tasks()
+    yield tasks
+    save_tasks(tasks)
+
+def _find_index(tasks: List[Dict], task_id: int) -> Optional[int]:
+    """Position of the task with the given ID in a caller-supplied list.
+
+    IDs are assigned monotonically and deletions preserve order, so the
+    list is normally sorted by ID and binary search finds the slot in
+    O(log N). A hand-edited out-of-order file falls back to the scan.
+    """
+    idx = bisect_left(tasks, task_id, key=lambda task: task['id'])
+    if idx < len(tasks) and tasks[idx]['id'] == task_id:
+        return idx
+    for i, task in enumerate(tasks):
+        if task['id'] == task_id:
+            return i
+    return None
+
+def get_task(task_id: int) -> Optional[Dict]:
+    """Return the task with the given ID, or None if it doesn't exist"""
+    state = _load_state()
+    idx = state['index'].get(task_id)
+    return state['tasks'][idx] if idx is not None else None
+
+def update_task(task_id: int, tasks: Optional[List[Dict]] = None, **fields) -> Optional[Dict]:
+    """Update fields on a single task and persist, returning the updated task.
+
+    Returns None (and writes nothing) if the task doesn't exist. When
+    ``tasks`` is given (batch mode), the list is edited in place and not
+    saved; the caller owns the save.
+    """
+    if tasks is None:
+        state = _load_state()
+        tasks = state['tasks']
+        idx = state['index'].get(task_id)
+        batched = False
+    else:
+        idx = _find_index(tasks, task_id)
+        batched = True
+    if idx is None:
+        return None
+    from datetime import datetime
+    task = tasks[idx]
+    task.update(fields)
+    task['updatedAt'] = datetime.now().isoformat()
+    if not batched:
+        save_tasks(tasks)
+    return task
+
+def delete_task(task_id: int, tasks: Optional[List[Dict]] = None) -> None:
+    """Remove the task with the given ID (a no-op if it doesn't exist).
+
+    When ``tasks`` is given (batch mode), the list is edited in place
+    and not saved; the caller owns the save.
+    """
+    if tasks is None:
+        state = _load_state()
+        tasks = state['tasks']
+        idx = state['index'].get(task_id)
+        batched = False
+    else:
+        idx = _find_index(tasks, task_id)
+        batched = True
+    if idx is not None:
+        # del keeps the remaining tasks in ID order
+        del tasks[idx]
+    if not batched:
+        save_tasks(tasks)
+
+def list_tasks(status: str = 'all') -> List[Dict]:
+    """Return tasks, filtered by status unless status is 'all'"""
+    state = _load_state()
+    if status == 'all':
+        return state['tasks']
+    code = _STATUS.get(status)
+    if code is None:
+        # Status outside the known set: compare strings directly
+        return [task for task in state['tasks'] if task['status'] == status]
+    # Filter over the status column rather than hashing into each dict
+    statuses = state['statuses']
+    return [task for i, task in enumerate(state['tasks']) if statuses[i] == code]
 
 @click.group()
 def cli():
@@ -47,42 +253,38 @@ def add(description: str):
 @click.argument('description')
 def update(task_id: int, description: str):
     """Update a task's description"""
-    tasks = load_tasks()
-    
-    for task in tasks:
-        if task['id'] == task_id:
-            task['description'] = description
-            task['updatedAt'] = datetime.now().isoformat()
-            save_tasks(tasks)
-            click.echo(f"Task {task_id} updated successfully")
-            return
-            
-    click.echo(f"Task {task_id} not found", err=True)
+    if update_task(task_id, description=description) is None:
+        click.echo(f"Task {task_id} not found", err=True)
+    else:
+        click.echo(f"Task {task_id} updated successfully")
 
 @cli.command()
 @click.argument('task_id', type=int)
 def delete(task_id: int):
     """Delete a task"""
-    tasks = load_tasks()
-    tasks = [task for task in tasks if task['id'] != task_id]
-    save_tasks(tasks)
+    delete_task(task_id)
     click.echo(f"Task {task_id} deleted successfully")
 
 @cli.command()
 @click.argument('status', type=click.Choice(['all', 'done', 'todo', 'in-progress']), default='all')
 def list(status: str):
     """List tasks, optionally filtered by status"""
-    tasks = load_tasks()
-    
-    if status != 'all':
-        tasks = [task for task in tasks if task['status'] == status]
-    
-    if not tasks:
+    # Filter over the status column (int compares) and format in one
+    # pass, then emit everything in one write instead of line by line
+    state = _load_state()
+    statuses = state['statuses']
+    code = _STATUS.get(status)
+    lines = [
+        f"[{task['id']}] {task['description']} ({task['status']})"
+        for i, task in enumerate(state['tasks'])
+        if status == 'all' or statuses[i] == code
+    ]
+
+    if not lines:
         click.echo("No tasks found")
         return
-        
-    for task in tasks:
-        click.echo(f"[{task['id']}] {task['description']} ({task['status']})")
+
+    click.echo('\n'.join(lines))
 
 @cli.command('mark-done')
 @click.argument('task_id', type=int)
@@ -96,43 +298,157 @@ def mark_in_progress(task_id: int):
     """Mark a task as in progress"""
     _update_task_status(task_id, 'in-progress')
 
+@cli.command()
+@click.argument('operations', nargs=-1, required=True)
+def bulk(operations):
+    """Apply several operations with one load and one save.
+
+    Each OPERATION is ACTION:VALUE — add:DESCRIPTION, done:ID,
+    in-progress:ID, delete:ID, or update:ID:DESCRIPTION. The batch is
+    validated up front: if any operation is malformed, nothing is
+    applied.
+    """
+    # Parse and validate every operation before applying any, so a bad
+    # operation late in the batch can't discard earlier mutations
+    parsed = []
+    for op in operations:
+        action, _, value = op.partition(':')
+        if action == 'add':
+            parsed.append((action, validate_description(value)))
+        elif action in ('done', 'in-progress', 'delete'):
+            parsed.append((action, _parse_id(value)))
+        elif action == 'update':
+            id_part, _, description = value.partition(':')
+            parsed.append((action, (_parse_id(id_part), validate_description(description))))
+        else:
+            raise click.BadParameter(f"Unknown operation: {op}")
+
+    # Buffer the per-operation messages and report only once the batch
+    # has actually been saved
+    messages = []
+    with open_tasks() as tasks:
+        for action, value in parsed:
+            if action == 'add':
+                new_task = add_task(value, tasks=tasks)
+                messages.append((f"Task added successfully (ID: {new_task['id']})", False))
+            elif action in ('done', 'in-progress'):
+                if update_task(value, tasks=tasks, status=action) is None:
+                    messages.append((f"Task {value} not found", True))
+                else:
+                    messages.append((f"Task {value} marked as {action}", False))
+            elif action == 'delete':
+                delete_task(value, tasks=tasks)
+                messages.append((f"Task {value} deleted successfully", False))
+            else:
+                task_id, description = value
+                if update_task(task_id, tasks=tasks, description=description) is None:
+                    messages.append((f"Task {task_id} not found", True))
+                else:
+                    messages.append((f"Task {task_id} updated successfully", False))
+
+    for message, err in messages:
+        click.echo(message, err=err)
+
+def _parse_id(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise click.BadParameter(f"Invalid task ID: {value!r}")
+
 def _update_task_status(task_id: int, status: str) -> None:
-    tasks = load_tasks()
-    
-    for task in tasks:
-        if task['id'] == task_id:
-            task['status'] = status
-            task['updatedAt'] = datetime.now().isoformat()
-            save_tasks(tasks)
-            click.echo(f"Task {task_id} marked as {status}")
-            return
-            
-    click.echo(f"Task {task_id} not found", err=True)
-
-def add_task(description: str) -> Dict:
-    tasks = load_tasks()
-    # Get the next ID (should be max + 1, even after deletions)
-    next_id = max([task['id'] for task in tasks], default=0) + 1
-    
-    new_task = {
-        "id": next_id,
+    if update_task(task_id, status=status) is None:
+        click.echo(f"Task {task_id} not found", err=True)
+    else:
+        click.echo(f"Task {task_id} marked as {status}")
+
+def _new_task(task_id: int, description: str) -> Dict:
+    from datetime import datetime
+
+    # Format the timestamp once so both fields are identical
+    now = datetime.now().isoformat()
+    return {
+        "id": task_id,
         "description": description,
         "status": "todo",
-        "createdAt": datetime.now().isoformat(),
-        "updatedAt": datetime.now().isoformat()
+        "createdAt": now,
+        "updatedAt": now
     }
+
+def add_task(description: str, tasks: Optional[List[Dict]] = None) -> Dict:
+    if tasks is not None:
+        # Batch mode: append to the caller's list, caller owns the save
+        next_id = max((task['id'] for task in tasks), default=0) + 1
+        new_task = _new_task(next_id, description)
+        tasks.append(new_task)
+        return new_task
+
+    state = _load_state()
+    tasks = state['tasks']
+    # Get the next ID (should be max + 1, even after deletions)
+    next_id = state['max_id'] + 1
+
+    new_task = _new_task(next_id, description)
     tasks.append(new_task)
-    save_tasks(tasks)
+    if state['legacy']:
+        # First write after a legacy array file rewrites it in NDJSON form
+        save_tasks(tasks)
+    else:
+        # Adding a task is a single appended line, not a full rewrite
+        _load_cache.clear()
+        with TASKS_FILE.open('ab') as f:
+            f.write(_encode_line(new_task))
+            _fsync_if_durable(f)
     return new_task
 
+_WS_RE = re.compile(r'\s+')
+
 def validate_description(description: str) -> str:
     """Validate and normalize task description"""
-    normalized = ' '.join(description.split())  # Normalize internal whitespace
+    # Single C-level regex pass; split()/join allocates a word list first
+    normalized = _WS_RE.sub(' ', description).strip()
     if not normalized:
         raise click.BadParameter("Task description cannot be empty")
     if len(normalized) > 500:
         raise click.BadParameter("Task description is too long")
     return normalized
 
+def main():
+    """Entry point with a fast path around Click for the hot commands.
+
+    Click's group dispatch (argument parsing, help machinery, context
+    setup) costs more than the commands themselves for simple calls.
+    When the invocation is plain positionals for a known command, call
+    the command's callback directly; anything else — options, --help,
+    unknown commands, malformed arguments — falls through to cli().
+    """
+    argv = sys.argv[1:]
+    if argv and not any(arg.startswith('-') for arg in argv):
+        cmd, args = argv[0], argv[1:]
+        try:
+            if cmd == 'add' and len(args) == 1:
+                add.callback(args[0])
+                return
+            if cmd == 'list' and (not args or args[0] in ('all', 'done', 'todo', 'in-progress')) and len(args) <= 1:
+                list.callback(args[0] if args else 'all')
+                return
+            if cmd in ('mark-done', 'mark-in-progress', 'delete') and len(args) == 1:
+                try:
+                    task_id = int(args[0])
+                except ValueError:
+                    # Let Click produce its usual usage error
+                    cli()
+                    return
+                if cmd == 'mark-done':
+                    mark_done.callback(task_id)
+                elif cmd == 'mark-in-progress':
+                    mark_in_progress.callback(task_id)
+                else:
+                    delete.callback(task_id)
+                return
+        except click.ClickException as e:
+            e.show()
+            sys.exit(e.exit_code)
+    cli()
+
 if __name__ == '__main__':
-    cli() 
\ No newline at end of file
+    main()
\ No newline at end of file
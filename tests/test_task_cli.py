@@ -2,7 +2,7 @@ import json
 import pytest
 from click.testing import CliRunner
 from pathlib import Path
-from task_cli import cli, TASKS_FILE, load_tasks, save_tasks
+from task_cli import cli, main, TASKS_FILE, load_tasks, save_tasks
 from datetime import datetime
 import time
 
@@ -158,6 +158,33 @@ class TestTaskCLI:
         assert '[2]' in done_result.output
         assert '[4]' in done_result.output
 
+    def test_bulk_command(self, runner, setup_test_file):
+        """Test applying several operations in a single invocation"""
+        result = runner.invoke(cli, [
+            'bulk', 'add:Task 1', 'add:Task 2', 'add:Task 3',
+            'done:1', 'in-progress:2', 'delete:3', 'update:2:Renamed task'
+        ])
+        assert result.exit_code == 0
+
+        tasks = load_tasks()
+        assert len(tasks) == 2
+        assert tasks[0]['status'] == 'done'
+        assert tasks[1]['status'] == 'in-progress'
+        assert tasks[1]['description'] == 'Renamed task'
+
+        # Unknown actions and bad IDs are rejected
+        result = runner.invoke(cli, ['bulk', 'frobnicate:1'])
+        assert result.exit_code != 0
+        result = runner.invoke(cli, ['bulk', 'done:abc'])
+        assert result.exit_code != 0
+
+        # A malformed operation rejects the whole batch: nothing is
+        # applied and no success messages are reported
+        result = runner.invoke(cli, ['bulk', 'add:Task 4', 'done:abc'])
+        assert result.exit_code != 0
+        assert 'Task added successfully' not in result.output
+        assert len(load_tasks()) == 2
+
     def test_error_handling(self, runner, setup_test_file):
         """Test various error conditions"""
         # Test invalid task ID
@@ -332,6 +359,45 @@ class TestTaskCLI:
             added_task = tasks[-1]
             assert added_task['description'] == desc.replace('\n', ' ').replace('\t', ' ')
 
+    def test_fast_path_entry_point(self, setup_test_file, monkeypatch, capsys):
+        """Test the Click-less dispatch for simple invocations"""
+        monkeypatch.setattr('sys.argv', ['task-cli', 'add', 'Fast task'])
+        main()
+        assert 'Task added successfully' in capsys.readouterr().out
+
+        monkeypatch.setattr('sys.argv', ['task-cli', 'mark-done', '1'])
+        main()
+        assert load_tasks()[0]['status'] == 'done'
+
+        monkeypatch.setattr('sys.argv', ['task-cli', 'list', 'done'])
+        main()
+        assert '[1] Fast task (done)' in capsys.readouterr().out
+
+        # Anything with options falls through to Click proper
+        monkeypatch.setattr('sys.argv', ['task-cli', '--help'])
+        with pytest.raises(SystemExit):
+            main()
+        assert 'Usage:' in capsys.readouterr().out
+
+    def test_large_file_handling(self, runner, setup_test_file):
+        """Test that a tasks file past the mmap threshold still loads"""
+        now = datetime.now().isoformat()
+        tasks = [
+            {"id": i, "description": f"Task {i} " + "x" * 150, "status": "todo",
+             "createdAt": now, "updatedAt": now}
+            for i in range(1, 5001)
+        ]
+        save_tasks(tasks)
+        assert setup_test_file.stat().st_size > 1_000_000
+
+        loaded = load_tasks()
+        assert len(loaded) == 5000
+        assert loaded[4999]['id'] == 5000
+
+        result = runner.invoke(cli, ['mark-done', '5000'])
+        assert result.exit_code == 0
+        assert load_tasks()[4999]['status'] == 'done'
+
     def test_concurrent_updates(self, runner, setup_test_file, sample_task):
         """Test handling of concurrent updates to the same task"""
         save_tasks([sample_task])